@@ -105,6 +105,15 @@ class Vent:
         # Convert the normalized position to a percentage of the way closed
         return normalized_position / (closed_pos - open_pos)
 
+    def get_step_size(self):
+        """
+        Get the change in position (0.0 to 1.0) produced by a single motor step.
+        Requires that open_position and closed_position have been set (calibrated).
+        """
+        open_pos = self.open_position if self.open_position is not None else 0
+        closed_pos = self.closed_position if self.closed_position is not None else ENCODER_MAX_VALUE
+        return ENCODER_MAX_VALUE / MOTOR_STEPS_PER_REVOLUTION / (closed_pos - open_pos)
+
     def open(self, amount=0.1):
         """
         Calculate the number of motor steps and target angle to open the air vent by the specified amount (0.0 to 1.0).
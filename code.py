@@ -11,7 +11,7 @@ from state_machine import StateMachine, State
 from hw_test import TestMotion, logger as test_logger
 from hardware import get_hardware, logger as hw_logger
 from airvent import create_vent_from_env
-from vent_closer import VentCloser, LinearVentFunction, logger as vent_logger
+from vent_closer import VentCloser, LinearVentFunction, ExponentialVentFunction, logger as vent_logger
 from vent_mover import MoveVentState, logger as vm_logger
 from logging import MQTTHandler, FileHandler
 from connections import (
@@ -25,8 +25,12 @@ from thermal_camera import get_thermal_camera, logger as cam_logger
 from stovelink import StoveLinkEncoder, logger as stovelink_logger
 
 VENT_CLOSE_TIME = os.getenv("VENT_CLOSE_TIME", 60 * 60)
+# Vent closing trajectory: "linear" or "exponential" (fast at first, fine steps near closed)
+VENT_CLOSE_PROFILE = os.getenv("VENT_CLOSE_PROFILE", "linear")
 THERMAL_CAMERA_INTERVAL = int(os.getenv("THERMAL_CAMERA_INTERVAL", 30))  # seconds
 THERMAL_MAX_TEMP_CHANGE = float(os.getenv("THERMAL_MAX_TEMP_CHANGE", 30.0))  # degrees C
+# Send StoveLink frames as uint8 in 2°C units (784 byte packets instead of 1552)
+STOVELINK_COMPACT = bool(int(os.getenv("STOVELINK_COMPACT", 0)))
 MEASUREMENT_BUFFER_INTERVAL = int(
     os.getenv("MEASUREMENT_BUFFER_INTERVAL", 15)
 )  # seconds
@@ -53,7 +57,8 @@ class IdleState(State):
         self.sensitivity = sensitivity
 
     def enter(self, machine):
-        hardware = machine.data["hardware"]
+        self._hardware = hardware = machine.data["hardware"]
+        self._vent = vent = machine.data["vent"]
         hardware.motor.release()
         hardware.set_pixel_color((0, 32, 32))  # teal
         vent.update_from_hardware(hardware.read_raw_angle())
@@ -61,7 +66,8 @@ class IdleState(State):
         logger.info("Idle")
 
     def resume(self, machine):
-        hardware = machine.data["hardware"]
+        self._hardware = hardware = machine.data["hardware"]
+        self._vent = machine.data["vent"]
         hardware.motor.release()
         if self.detected_fully_closed:
             hardware.set_pixel_color((0x8F, 0x8F, 0))  # yellow
@@ -73,8 +79,8 @@ class IdleState(State):
         return True
 
     def update(self, machine):
-        hardware = machine.data["hardware"]
-        vent = machine.data["vent"]
+        hardware = self._hardware
+        vent = self._vent
         vent.update_from_hardware(hardware.read_raw_angle())
         vent_position = vent.get_position()
         # Check MQTT when vent position is stable
@@ -250,7 +256,7 @@ def do_thermal_camera_stuff(camera_exception_raised):
 
     camera_start_time = time.monotonic()
     frame = thermal_camera.capture_frame()
-    if frame:
+    if frame is not None:
         # Calculate temperature statistics
         stats_start_time = time.monotonic()
         np_frame = thermal_camera.get_np_frame()
@@ -264,9 +270,14 @@ def do_thermal_camera_stuff(camera_exception_raised):
             stovelink_start = time.monotonic()
             vent_position = vent.get_position()
             combustion_time = get_combustion_time(closer_function)
-            stovelink_packet = stovelink_encoder.encode_packet(
-                np_frame, vent_position, combustion_time
-            )
+            if STOVELINK_COMPACT:
+                stovelink_packet = stovelink_encoder.encode_packet_compact(
+                    np_frame, vent_position, combustion_time
+                )
+            else:
+                stovelink_packet = stovelink_encoder.encode_packet(
+                    np_frame, vent_position, combustion_time
+                )
             try:
                 mqtt_client.publish(
                     mqtt_topic + "/stovelink", stovelink_packet
@@ -338,7 +349,10 @@ if __name__ == "__main__":
     hardware = get_hardware()
     hardware.led_on()
     vent = create_vent_from_env()
-    closer_function = LinearVentFunction(VENT_CLOSE_TIME)
+    if VENT_CLOSE_PROFILE == "exponential":
+        closer_function = ExponentialVentFunction(VENT_CLOSE_TIME)
+    else:
+        closer_function = LinearVentFunction(VENT_CLOSE_TIME)
     machine = init_state_machine(mqtt_client, hardware, vent, closer_function)
 
     # Initialize thermal camera and StoveLink encoder
@@ -436,7 +450,10 @@ if __name__ == "__main__":
                 try:
                     if do_thermal_camera_stuff(camera_exception_raised):
                         camera_exception_raised = False
-                    last_camera_update = current_time
+                    # After a transient capture failure, retry on the next loop iteration;
+                    # the camera resets retry_count once it gives up on the frame
+                    if camera_exception_raised or thermal_camera.retry_count == 0:
+                        last_camera_update = current_time
 
                 except OSError as e:
                     # I2C communication error with thermal camera (e.g., errno 32: broken pipe)
@@ -17,6 +17,10 @@ logger.setLevel(logging.INFO)
 class Hardware:
 
     is_mock = False
+
+    # Last encoder reading for read_raw_angle_cached() and its time.monotonic_ns() timestamp
+    _angle_cache = None
+    _angle_cache_time = None
     
     def __init__(self, i2c):
         self.i2c = i2c
@@ -48,11 +52,28 @@ class Hardware:
 
         return raw_angle_high[0] << 8 | raw_angle_low[0]
 
+    def read_raw_angle_cached(self, max_age_ms=20):
+        """
+        Like read_raw_angle(), but reuses the last reading if it is at most max_age_ms old,
+        so back-to-back reads in the same state machine tick cost one I2C transaction.
+        The cache is dropped whenever the motor moves; otherwise it expires after max_age_ms.
+        """
+        now = time.monotonic_ns()
+        if self._angle_cache_time is None or now - self._angle_cache_time > max_age_ms * 1000000:
+            self._angle_cache = self.read_raw_angle()
+            self._angle_cache_time = now
+        return self._angle_cache
+
+    def invalidate_angle_cache(self):
+        """Force the next read_raw_angle_cached() to read the encoder."""
+        self._angle_cache_time = None
+
     def tmp36_temperature_C(self):
         millivolts = self.tmp36.value * (self.tmp36.reference_voltage * 1000 / 65535)
         return (millivolts - 500) / 10
 
     def _move(self, direction, steps, delay=0.05):
+        self.invalidate_angle_cache()
         for i in range(steps):
             self.motor.onestep(direction=direction, style=stepper.DOUBLE)
             time.sleep(delay)
@@ -65,6 +86,14 @@ class Hardware:
         self._move(stepper.FORWARD, amount, delay)
         self.motor.release()
 
+    def move(self, steps, delay=0.05):
+        "Move by a signed number of steps: positive closes the vent, negative opens it"
+        if steps < 0:
+            self._move(stepper.FORWARD, -steps, delay)
+        else:
+            self._move(stepper.BACKWARD, steps, delay)
+        self.motor.release()
+
     def set_pixel_color(self, color):
         self.pixels[0] = color
 
@@ -160,9 +189,11 @@ class MockHardware(Hardware):
 
     def mock_move_to_angle(self, angle):
         self.current_angle = angle
+        self.invalidate_angle_cache()
 
     def mock_move_to_raw_angle(self, raw_angle):
         self.current_angle = ((raw_angle - self.open_position + 4096) * 360 / 4096) % 360
+        self.invalidate_angle_cache()
 
 
 
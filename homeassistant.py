@@ -77,7 +77,8 @@ class HomeAssistant:
                     "p": "binary_sensor",
                     "ent_cat": "diagnostic",
                     "unique_id": f"{self.device_name}_encoder_md",
-                    "state_topic": f"{self.topic_prefix}/encoder_md/state",
+                    "state_topic": f"{self.topic_prefix}/encoder/state",
+                    "value_template": "{{ value_json.md }}",
                     "icon": "mdi:magnet",
                     "avty": [
                         {"topic": f"{self.topic_prefix}/status"},
@@ -88,7 +89,8 @@ class HomeAssistant:
                     "p": "binary_sensor",
                     "ent_cat": "diagnostic",
                     "unique_id": f"{self.device_name}_encoder_ml",
-                    "state_topic": f"{self.topic_prefix}/encoder_ml/state",
+                    "state_topic": f"{self.topic_prefix}/encoder/state",
+                    "value_template": "{{ value_json.ml }}",
                     "icon": "mdi:magnet",
                     "avty": [
                         {"topic": f"{self.topic_prefix}/status"},
@@ -99,7 +101,8 @@ class HomeAssistant:
                     "p": "binary_sensor",
                     "ent_cat": "diagnostic",
                     "unique_id": f"{self.device_name}_encoder_mh",
-                    "state_topic": f"{self.topic_prefix}/encoder_mh/state",
+                    "state_topic": f"{self.topic_prefix}/encoder/state",
+                    "value_template": "{{ value_json.mh }}",
                     "icon": "mdi:magnet",
                     "avty": [
                         {"topic": f"{self.topic_prefix}/status"},
@@ -326,16 +329,20 @@ class HomeAssistant:
         }
 
     def send_encoder_status(self, status_md, status_ml, status_mh):
-        """Update encoder_magnet_detected, encoder_magnet_weak, and encoder_magnet_strong components"""
+        """
+        Update encoder_magnet_detected, encoder_magnet_weak, and encoder_magnet_strong components.
+        All three share one JSON state topic, so an update is a single MQTT publish.
+        """
         state_string = lambda value: "ON" if value else "OFF"
         self.publish(
-            f"{self.topic_prefix}/encoder_md/state", state_string(status_md)
-        )
-        self.publish(
-            f"{self.topic_prefix}/encoder_ml/state", state_string(status_ml)
-        )
-        self.publish(
-            f"{self.topic_prefix}/encoder_mh/state", state_string(status_mh)
+            f"{self.topic_prefix}/encoder/state",
+            json.dumps(
+                {
+                    "md": state_string(status_md),
+                    "ml": state_string(status_ml),
+                    "mh": state_string(status_mh),
+                }
+            ),
         )
 
     def clear_cached_state(self):
@@ -0,0 +1,7 @@
+"""pytest configuration for the StoveLink service tests."""
+
+import os
+import sys
+
+# Make stovelink_service importable regardless of the directory pytest is launched from
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
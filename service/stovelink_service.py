@@ -39,6 +39,9 @@ import paho.mqtt.client as mqtt
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# StoveLink header: sequence id, timestamp, vent position, combustion time, body format
+HEADER_STRUCT = struct.Struct("<IIfHH")
+
 
 class StoveLinkDecoder:
     """
@@ -48,15 +51,20 @@ class StoveLinkDecoder:
     """
 
     PACKET_SIZE = 1552  # 16 byte header + 1536 byte body
+    COMPACT_PACKET_SIZE = 784  # 16 byte header + 768 byte body
     HEADER_SIZE = 16
     THERMAL_PIXELS = 768  # 32x24
 
+    # Body format flag carried in the header's formerly reserved uint16 field
+    BODY_FORMAT_UINT16 = 0  # 768 x uint16, 0.1°C units
+    BODY_FORMAT_UINT8 = 1  # 768 x uint8, 2°C units (compact)
+
     def decode_packet(self, packet: bytes) -> dict:
         """
         Decode a StoveLink binary packet.
 
         Args:
-            packet: Binary packet data (1552 bytes)
+            packet: Binary packet data (1552 bytes, or 784 bytes in compact format)
 
         Returns:
             dict: Decoded packet with keys:
@@ -67,24 +75,36 @@ class StoveLinkDecoder:
                 - thermal_frame: Numpy array of 768 temperatures in Celsius (float)
 
         Raises:
-            ValueError: If packet size is incorrect
+            ValueError: If packet size is incorrect or the body format is unknown
         """
-        if len(packet) != self.PACKET_SIZE:
+        if len(packet) not in (self.PACKET_SIZE, self.COMPACT_PACKET_SIZE):
             raise ValueError(
-                f"Invalid packet size: {len(packet)} bytes (expected {self.PACKET_SIZE})"
+                f"Invalid packet size: {len(packet)} bytes "
+                f"(expected {self.PACKET_SIZE} or {self.COMPACT_PACKET_SIZE})"
             )
 
         # Decode header (16 bytes, little-endian)
-        header = packet[: self.HEADER_SIZE]
-        seq_id, timestamp, vent_pct, comb_time, reserved = struct.unpack("<IIfHH", header)
+        seq_id, timestamp, vent_pct, comb_time, body_format = HEADER_STRUCT.unpack_from(packet)
+
+        if body_format == self.BODY_FORMAT_UINT16:
+            expected_size, dtype, scale = self.PACKET_SIZE, "<u2", 10.0
+        elif body_format == self.BODY_FORMAT_UINT8:
+            expected_size, dtype, scale = self.COMPACT_PACKET_SIZE, "u1", 0.5
+        else:
+            raise ValueError(f"Unknown body format: {body_format}")
+
+        if len(packet) != expected_size:
+            raise ValueError(
+                f"Invalid packet size: {len(packet)} bytes (expected {expected_size} "
+                f"for body format {body_format})"
+            )
 
-        # Decode thermal frame (1536 bytes = 768 x uint16)
-        body = packet[self.HEADER_SIZE :]
-        thermal_uint16 = struct.unpack("<768H", body)
+        # Decode thermal frame (768 values)
+        # Explicit little-endian dtype keeps the decode correct on big-endian hosts
+        raw = np.frombuffer(packet, dtype=dtype, count=self.THERMAL_PIXELS, offset=self.HEADER_SIZE)
 
-        # Convert thermal data from uint16 (0.1°C units) to float (°C)
-        thermal_frame = np.array([temp / 10.0 for temp in thermal_uint16], dtype=np.float32)
-        thermal_frame = thermal_frame.reshape(24, 32)
+        # Convert thermal data from 0.1°C (or 2°C) units to float (°C)
+        thermal_frame = (raw.astype(np.float32) / np.float32(scale)).reshape(24, 32)
 
         return {
             "sequence_id": seq_id,
@@ -107,6 +127,10 @@ class ThermalImageGenerator:
         self.fixed_min_temp = min_temp
         self.fixed_max_temp = max_temp
 
+        # Dimensions are fixed, so the BMP header is built once and reused for every frame
+        self._bmp_header = self._build_bmp_header(width, height)
+        assert len(self._bmp_header) == 54, "BMP header must be 54 bytes"
+
     def frame_to_rgb(self, frame: np.ndarray, colormap="ironbow") -> np.ndarray:
         """
         Convert thermal frame to RGB data.
@@ -186,19 +210,18 @@ class ThermalImageGenerator:
 
         return np.stack([r, g, b], axis=-1)
 
-    def encode_bmp(self, rgb_data: np.ndarray) -> bytes:
+    @staticmethod
+    def _build_bmp_header(width: int, height: int) -> bytes:
         """
-        Encode RGB data to BMP format.
+        Build the 54-byte BMP file + DIB header for a 24-bit image.
 
         Args:
-            rgb_data: RGB pixel data (height, width, 3)
+            width: Image width in pixels
+            height: Image height in pixels
 
         Returns:
-            bytes: BMP file data
+            bytes: BMP header
         """
-        height, width = rgb_data.shape[:2]
-
-        # BMP file header (14 bytes)
         row_size = ((width * 3 + 3) // 4) * 4  # Rows must be padded to 4-byte boundary
         pixel_array_size = row_size * height
         file_size = 54 + pixel_array_size  # 54 = header size
@@ -218,8 +241,21 @@ class ThermalImageGenerator:
         bmp_header[28:30] = (24).to_bytes(2, "little")  # Bits per pixel
         bmp_header[34:38] = pixel_array_size.to_bytes(4, "little")  # Image size
 
-        # Build pixel array (BMP stores rows bottom-to-top, BGR format)
-        pixel_data = bytearray(pixel_array_size)
+        return bytes(bmp_header)
+
+    def _rows_to_bmp_bytes(self, rgb_data: np.ndarray) -> bytearray:
+        """
+        Convert RGB rows to the BMP pixel array (bottom-up rows, BGR, 4-byte row padding).
+
+        Args:
+            rgb_data: RGB pixel data (height, width, 3)
+
+        Returns:
+            bytearray: BMP pixel array
+        """
+        height, width = rgb_data.shape[:2]
+        row_size = ((width * 3 + 3) // 4) * 4
+        pixel_data = bytearray(row_size * height)
 
         for y in range(height):
             # Flip row order (BMP is bottom-up)
@@ -235,7 +271,25 @@ class ThermalImageGenerator:
                 pixel_data[dst_idx + 1] = rgb_data[src_idx][1]  # G
                 pixel_data[dst_idx + 2] = rgb_data[src_idx][0]  # R
 
-        return bytes(bmp_header + pixel_data)
+        return pixel_data
+
+    def encode_bmp(self, rgb_data: np.ndarray) -> bytes:
+        """
+        Encode RGB data to BMP format.
+
+        Args:
+            rgb_data: RGB pixel data (height, width, 3)
+
+        Returns:
+            bytes: BMP file data
+        """
+        height, width = rgb_data.shape[:2]
+        if (width, height) == (self.width, self.height):
+            bmp_header = self._bmp_header
+        else:
+            bmp_header = self._build_bmp_header(width, height)
+
+        return bmp_header + self._rows_to_bmp_bytes(rgb_data)
 
     def get_base64_image(self, frame: np.ndarray, colormap="ironbow") -> str:
         """
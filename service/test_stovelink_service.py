@@ -2,319 +2,300 @@
 """
 Test suite for StoveLink service components.
 Tests ThermalImageGenerator image flip and encoding.
+
+Run with pytest from the service directory (conftest.py puts it on sys.path):
+    python -m pytest -q
 """
 
 import sys
 import numpy as np
 import base64
-from io import BytesIO
-
-# Add service directory to path
-sys.path.insert(0, "/Users/martin/Hacking/hearthmate/service")
+import pytest
 
 from stovelink_service import ThermalImageGenerator, StoveLinkDecoder
 import struct
 
 
-class TestThermalImageGenerator:
-    """Test cases for ThermalImageGenerator"""
+@pytest.fixture
+def generator():
+    """Dynamic-range image generator for a 32x24 frame"""
+    return ThermalImageGenerator(width=32, height=24)
+
+
+def test_frame_to_rgb_shape(generator):
+    """Test that frame_to_rgb produces correct shape RGB output"""
+    print("\n=== Test 1: Frame to RGB Shape ===")
+
+    # Create a test frame (24x32)
+    frame = np.ones((24, 32), dtype=np.float32) * 25.0
+
+    rgb_data = generator.frame_to_rgb(frame)
+
+    print(f"Input frame shape: {frame.shape}")
+    print(f"Output RGB shape: {rgb_data.shape}")
+    print(f"Expected shape: (24, 32, 3)")
+
+    assert rgb_data.shape == (24, 32, 3), f"Shape mismatch: {rgb_data.shape} != (24, 32, 3)"
+    assert rgb_data.dtype == np.uint8, f"Dtype should be uint8, got {rgb_data.dtype}"
+
+    print("✓ Frame to RGB shape test passed")
+
+
+def test_horizontal_flip(generator):
+    """Test that frame_to_rgb flips the image left-right"""
+    print("\n=== Test 2: Horizontal Flip ===")
+
+    # Create a frame with distinctive left-right pattern
+    # Left side: cold (20°C), Right side: hot (80°C)
+    frame = np.ones((24, 32), dtype=np.float32)
+    frame[:, :16] = 20.0  # Left half: cold
+    frame[:, 16:] = 80.0  # Right half: hot
+
+    rgb_data = generator.frame_to_rgb(frame)
+
+    # After flipping:
+    # - Left side should be hot (was right)
+    # - Right side should be cold (was left)
+
+    # In RGB data, hot pixels will have high R value, cold will have high B value
+    left_pixels = rgb_data[:, :8, :]  # Leftmost 8 columns
+    right_pixels = rgb_data[:, -8:, :]  # Rightmost 8 columns
+
+    left_avg_r = np.mean(left_pixels[:, :, 0])
+    right_avg_r = np.mean(right_pixels[:, :, 0])
+
+    left_avg_b = np.mean(left_pixels[:, :, 2])
+    right_avg_b = np.mean(right_pixels[:, :, 2])
+
+    print(f"Original: Left=20°C (cold), Right=80°C (hot)")
+    print(f"After flip:")
+    print(f"  Left pixels: avg R={left_avg_r:.1f}, avg B={left_avg_b:.1f}")
+    print(f"  Right pixels: avg R={right_avg_r:.1f}, avg B={right_avg_b:.1f}")
+    print(f"Expected: Left should be hot (high R), Right should be cold (high B)")
+
+    # After flip, left should be hotter than right
+    # This is verified by R channel being higher on left than right
+    assert left_avg_r > right_avg_r, (
+        f"Left side R should be higher than right (flip not working): {left_avg_r} vs {right_avg_r}"
+    )
+    assert left_avg_b < right_avg_b, (
+        f"Left side B should be lower than right (flip not working): {left_avg_b} vs {right_avg_b}"
+    )
+
+    print("✓ Horizontal flip test passed")
+
+
+def test_grayscale_colormap(generator):
+    """Test grayscale colormap output"""
+    print("\n=== Test 3: Grayscale Colormap ===")
+
+    frame = np.array([[10.0, 30.0], [50.0, 70.0]], dtype=np.float32)
+
+    rgb_data = generator.frame_to_rgb(frame, colormap="grayscale")
+
+    # In grayscale, R=G=B for each pixel
+    print(f"Grayscale output shape: {rgb_data.shape}")
+
+    r, g, b = rgb_data[..., 0], rgb_data[..., 1], rgb_data[..., 2]
+    np.testing.assert_array_equal(r, g, err_msg="Grayscale mismatch between R and G")
+    np.testing.assert_array_equal(g, b, err_msg="Grayscale mismatch between G and B")
+
+    print("✓ Grayscale colormap test passed")
+
+
+def test_ironbow_colormap(generator):
+    """Test ironbow colormap produces distinct colors"""
+    print("\n=== Test 4: Ironbow Colormap ===")
+
+    # Create frame with temperature gradient (proper 24x32 size)
+    frame = np.zeros((24, 32), dtype=np.float32)
+    frame[:12, :] = 10.0  # Top half: cold
+    frame[12:, :] = 110.0  # Bottom half: hot
+
+    rgb_data = generator.frame_to_rgb(frame, colormap="ironbow")
+
+    print(f"Temperature gradient: {frame.min():.1f}°C to {frame.max():.1f}°C")
+    print(f"RGB output shape: {rgb_data.shape}")
+
+    # Verify that different temperatures produce different colors
+    cold_pixels = rgb_data[:6, :, :]  # Top section: cold
+    hot_pixels = rgb_data[-6:, :, :]  # Bottom section: hot
+
+    cold_pixel = np.mean(cold_pixels, axis=(0, 1)).astype(int)
+    hot_pixel = np.mean(hot_pixels, axis=(0, 1)).astype(int)
+
+    print(f"Cold pixel avg (10°C): R={cold_pixel[0]}, G={cold_pixel[1]}, B={cold_pixel[2]}")
+    print(f"Hot pixel avg (110°C): R={hot_pixel[0]}, G={hot_pixel[1]}, B={hot_pixel[2]}")
+
+    # Cold should have more blue, hot should have more red
+    assert cold_pixel[2] > cold_pixel[0], "Cold pixels should be blue"
+    assert hot_pixel[0] > hot_pixel[2], "Hot pixels should be red"
+
+    print("✓ Ironbow colormap test passed")
+
+
+def test_encode_bmp(generator):
+    """Test BMP encoding produces valid BMP data"""
+    print("\n=== Test 5: BMP Encoding ===")
+
+    # Create simple RGB data
+    rgb_data = np.zeros((24, 32, 3), dtype=np.uint8)
+    rgb_data[:, :, 0] = 255  # Red channel
+
+    bmp_data = generator.encode_bmp(rgb_data)
+
+    print(f"BMP data size: {len(bmp_data)} bytes")
+    print(f"First 2 bytes: {bmp_data[:2]}")
+
+    # Check BMP signature
+    assert bmp_data[:2] == b"BM", f"BMP signature invalid: {bmp_data[:2]}"
+
+    # Parse file size from header (bytes 2-6, little-endian)
+    file_size = struct.unpack("<I", bmp_data[2:6])[0]
+    print(f"File size from header: {file_size}")
+    assert len(bmp_data) == file_size, f"File size mismatch: {len(bmp_data)} != {file_size}"
 
-    def __init__(self):
-        self.generator = ThermalImageGenerator(width=32, height=24)
-        self.test_count = 0
-        self.passed_count = 0
+    # Parse pixel data offset (bytes 10-14, little-endian)
+    pixel_offset = struct.unpack("<I", bmp_data[10:14])[0]
+    print(f"Pixel data offset: {pixel_offset}")
+    assert pixel_offset == 54, f"Pixel offset should be 54, got {pixel_offset}"
 
-    def test_frame_to_rgb_shape(self):
-        """Test that frame_to_rgb produces correct shape RGB output"""
-        print("\n=== Test 1: Frame to RGB Shape ===")
-        self.test_count += 1
+    print("✓ BMP encoding test passed")
 
-        # Create a test frame (24x32)
-        frame = np.ones((24, 32), dtype=np.float32) * 25.0
 
-        rgb_data = self.generator.frame_to_rgb(frame)
+def test_base64_encoding(generator):
+    """Test get_base64_image returns valid base64"""
+    print("\n=== Test 6: Base64 Encoding ===")
 
-        print(f"Input frame shape: {frame.shape}")
-        print(f"Output RGB shape: {rgb_data.shape}")
-        print(f"Expected shape: (24, 32, 3)")
+    frame = np.ones((24, 32), dtype=np.float32) * 25.0
+    base64_image = generator.get_base64_image(frame)
 
-        assert rgb_data.shape == (24, 32, 3), f"Shape mismatch: {rgb_data.shape} != (24, 32, 3)"
-        assert rgb_data.dtype == np.uint8, f"Dtype should be uint8, got {rgb_data.dtype}"
+    print(f"Base64 string length: {len(base64_image)}")
 
-        print("✓ Frame to RGB shape test passed")
-        self.passed_count += 1
+    # Verify it's valid base64
+    try:
+        decoded = base64.b64decode(base64_image)
+        print(f"Decoded BMP size: {len(decoded)} bytes")
+        assert decoded[:2] == b"BM", "Decoded data should be BMP"
+        print("✓ Base64 encoding test passed")
+    except Exception as e:
+        print(f"✗ Base64 decoding failed: {e}")
+        raise
 
-    def test_horizontal_flip(self):
-        """Test that frame_to_rgb flips the image left-right"""
-        print("\n=== Test 2: Horizontal Flip ===")
-        self.test_count += 1
 
-        # Create a frame with distinctive left-right pattern
-        # Left side: cold (20°C), Right side: hot (80°C)
-        frame = np.ones((24, 32), dtype=np.float32)
-        frame[:, :16] = 20.0  # Left half: cold
-        frame[:, 16:] = 80.0  # Right half: hot
+def test_fixed_temperature_range(generator):
+    """Test fixed min/max temperature range"""
+    print("\n=== Test 7: Fixed Temperature Range ===")
 
-        rgb_data = self.generator.frame_to_rgb(frame)
+    # Create generator with fixed range 0-100°C
+    fixed_generator = ThermalImageGenerator(width=32, height=24, min_temp=0.0, max_temp=100.0)
 
-        # After flipping:
-        # - Left side should be hot (was right)
-        # - Right side should be cold (was left)
+    # Create frame with temperatures outside the fixed range
+    frame = np.ones((24, 32), dtype=np.float32) * 200.0  # All pixels 200°C
 
-        # In RGB data, hot pixels will have high R value, cold will have high B value
-        left_pixels = rgb_data[:, :8, :]  # Leftmost 8 columns
-        right_pixels = rgb_data[:, -8:, :]  # Rightmost 8 columns
+    # Generate RGB with fixed range
+    rgb_fixed = fixed_generator.frame_to_rgb(frame)
 
-        left_avg_r = np.mean(left_pixels[:, :, 0])
-        right_avg_r = np.mean(right_pixels[:, :, 0])
+    # Generate RGB with dynamic range (should be all white since all same temp)
+    rgb_dynamic = generator.frame_to_rgb(frame)
 
-        left_avg_b = np.mean(left_pixels[:, :, 2])
-        right_avg_b = np.mean(right_pixels[:, :, 2])
+    print(f"Frame temperature: {frame[0, 0]:.1f}°C")
+    print(f"Fixed range: 0-100°C")
+    print(f"Dynamic range: {frame.min():.1f}-{frame.max():.1f}°C")
 
-        print(f"Original: Left=20°C (cold), Right=80°C (hot)")
-        print(f"After flip:")
-        print(f"  Left pixels: avg R={left_avg_r:.1f}, avg B={left_avg_b:.1f}")
-        print(f"  Right pixels: avg R={right_avg_r:.1f}, avg B={right_avg_b:.1f}")
-        print(f"Expected: Left should be hot (high R), Right should be cold (high B)")
+    # With fixed range 0-100, 200°C should map to max (1.0 normalized)
+    # In ironbow, max temp is red
+    avg_r_fixed = np.mean(rgb_fixed[:, :, 0])
+    avg_g_fixed = np.mean(rgb_fixed[:, :, 1])
+    avg_b_fixed = np.mean(rgb_fixed[:, :, 2])
 
-        # After flip, left should be hotter than right
-        # This is verified by R channel being higher on left than right
-        assert left_avg_r > right_avg_r, (
-            f"Left side R should be higher than right (flip not working): {left_avg_r} vs {right_avg_r}"
-        )
-        assert left_avg_b < right_avg_b, (
-            f"Left side B should be lower than right (flip not working): {left_avg_b} vs {right_avg_b}"
-        )
+    print(f"Fixed range RGB avg: R={avg_r_fixed:.1f}, G={avg_g_fixed:.1f}, B={avg_b_fixed:.1f}")
 
-        print("✓ Horizontal flip test passed")
-        self.passed_count += 1
+    # Should be red (high R, low G/B)
+    assert avg_r_fixed > 200, "Fixed range should produce red colors for high temp"
+    assert avg_g_fixed < 100, "Fixed range should have low green"
+    assert avg_b_fixed < 100, "Fixed range should have low blue"
 
-    def test_grayscale_colormap(self):
-        """Test grayscale colormap output"""
-        print("\n=== Test 3: Grayscale Colormap ===")
-        self.test_count += 1
+    print("✓ Fixed temperature range test passed")
 
-        frame = np.array([[10.0, 30.0], [50.0, 70.0]], dtype=np.float32)
 
-        rgb_data = self.generator.frame_to_rgb(frame, colormap="grayscale")
+def test_stovelink_decoder_integration(generator):
+    """Test integration with StoveLinkDecoder"""
+    print("\n=== Test 8: StoveLink Decoder Integration ===")
 
-        # In grayscale, R=G=B for each pixel
-        print(f"Grayscale output shape: {rgb_data.shape}")
+    decoder = StoveLinkDecoder()
 
-        for i in range(rgb_data.shape[0]):
-            for j in range(rgb_data.shape[1]):
-                r, g, b = rgb_data[i, j, :]
-                assert r == g == b, f"Grayscale mismatch at ({i},{j}): R={r}, G={g}, B={b}"
+    # Create a test packet
+    header = struct.pack(
+        "<IIfHH",
+        0,  # sequence_id
+        1000,  # timestamp_ms
+        50.0,  # vent_pct
+        300,  # combustion_time
+        0,  # body_format (uint16)
+    )
 
-        print("✓ Grayscale colormap test passed")
-        self.passed_count += 1
+    # Create thermal data with left-right gradient
+    # Pattern: left side cooler, right side hotter (20-80°C gradient across columns)
+    cols = np.arange(32, dtype=np.float32)
+    temps = (20.0 + cols * (60.0 / 32.0)) * 10.0  # Convert to 0.1°C units
+    thermal_data = np.tile(temps.astype("<u2"), 24)
 
-    def test_ironbow_colormap(self):
-        """Test ironbow colormap produces distinct colors"""
-        print("\n=== Test 4: Ironbow Colormap ===")
-        self.test_count += 1
+    body = thermal_data.tobytes()
+    packet = header + body
 
-        # Create frame with temperature gradient (proper 24x32 size)
-        frame = np.zeros((24, 32), dtype=np.float32)
-        frame[:12, :] = 10.0  # Top half: cold
-        frame[12:, :] = 110.0  # Bottom half: hot
+    # Decode packet
+    decoded = decoder.decode_packet(packet)
+    thermal_frame = decoded["thermal_frame"]
 
-        rgb_data = self.generator.frame_to_rgb(frame, colormap="ironbow")
+    print(f"Decoded thermal frame shape: {thermal_frame.shape}")
+    print(f"Frame min temp: {thermal_frame.min():.1f}°C, max temp: {thermal_frame.max():.1f}°C")
 
-        print(f"Temperature gradient: {frame.min():.1f}°C to {frame.max():.1f}°C")
-        print(f"RGB output shape: {rgb_data.shape}")
+    # Generate RGB image (should be flipped)
+    rgb_data = generator.frame_to_rgb(thermal_frame)
 
-        # Verify that different temperatures produce different colors
-        cold_pixels = rgb_data[:6, :, :]  # Top section: cold
-        hot_pixels = rgb_data[-6:, :, :]  # Bottom section: hot
+    print(f"Generated RGB shape: {rgb_data.shape}")
 
-        cold_pixel = np.mean(cold_pixels, axis=(0, 1)).astype(int)
-        hot_pixel = np.mean(hot_pixels, axis=(0, 1)).astype(int)
+    # After flip, left should be hot, right should be cool
+    left_pixels = rgb_data[:, :8, :]
+    right_pixels = rgb_data[:, -8:, :]
 
-        print(f"Cold pixel avg (10°C): R={cold_pixel[0]}, G={cold_pixel[1]}, B={cold_pixel[2]}")
-        print(f"Hot pixel avg (110°C): R={hot_pixel[0]}, G={hot_pixel[1]}, B={hot_pixel[2]}")
+    left_avg_r = np.mean(left_pixels[:, :, 0])
+    right_avg_r = np.mean(right_pixels[:, :, 0])
 
-        # Cold should have more blue, hot should have more red
-        assert cold_pixel[2] > cold_pixel[0], "Cold pixels should be blue"
-        assert hot_pixel[0] > hot_pixel[2], "Hot pixels should be red"
+    print(f"After flip - Left R avg: {left_avg_r:.1f}, Right R avg: {right_avg_r:.1f}")
+    assert left_avg_r > right_avg_r, "Flip should reverse temperature gradient"
 
-        print("✓ Ironbow colormap test passed")
-        self.passed_count += 1
+    print("✓ StoveLink decoder integration test passed")
 
-    def test_encode_bmp(self):
-        """Test BMP encoding produces valid BMP data"""
-        print("\n=== Test 5: BMP Encoding ===")
-        self.test_count += 1
 
-        # Create simple RGB data
-        rgb_data = np.zeros((24, 32, 3), dtype=np.uint8)
-        rgb_data[:, :, 0] = 255  # Red channel
-
-        bmp_data = self.generator.encode_bmp(rgb_data)
-
-        print(f"BMP data size: {len(bmp_data)} bytes")
-        print(f"First 2 bytes: {bmp_data[:2]}")
+def test_stovelink_decoder_compact_format():
+    """Test decoding of the compact uint8 (2°C units) body format"""
+    print("\n=== Test 9: StoveLink Decoder Compact Format ===")
 
-        # Check BMP signature
-        assert bmp_data[:2] == b"BM", f"BMP signature invalid: {bmp_data[:2]}"
-
-        # Parse file size from header (bytes 2-6, little-endian)
-        file_size = struct.unpack("<I", bmp_data[2:6])[0]
-        print(f"File size from header: {file_size}")
-        assert len(bmp_data) == file_size, f"File size mismatch: {len(bmp_data)} != {file_size}"
-
-        # Parse pixel data offset (bytes 10-14, little-endian)
-        pixel_offset = struct.unpack("<I", bmp_data[10:14])[0]
-        print(f"Pixel data offset: {pixel_offset}")
-        assert pixel_offset == 54, f"Pixel offset should be 54, got {pixel_offset}"
+    decoder = StoveLinkDecoder()
 
-        print("✓ BMP encoding test passed")
-        self.passed_count += 1
+    header = struct.pack("<IIfHH", 7, 2000, 25.0, 60, StoveLinkDecoder.BODY_FORMAT_UINT8)
+    body = np.tile(np.arange(32, dtype=np.uint8) * 8, 24).tobytes()  # 0-496°C in 2°C units
+    packet = header + body
 
-    def test_base64_encoding(self):
-        """Test get_base64_image returns valid base64"""
-        print("\n=== Test 6: Base64 Encoding ===")
-        self.test_count += 1
+    assert len(packet) == StoveLinkDecoder.COMPACT_PACKET_SIZE
 
-        frame = np.ones((24, 32), dtype=np.float32) * 25.0
-        base64_image = self.generator.get_base64_image(frame)
+    decoded = decoder.decode_packet(packet)
+    thermal_frame = decoded["thermal_frame"]
 
-        print(f"Base64 string length: {len(base64_image)}")
+    assert decoded["sequence_id"] == 7
+    assert decoded["combustion_time"] == 60
+    assert thermal_frame.shape == (24, 32)
+    np.testing.assert_array_equal(thermal_frame[0], np.arange(32, dtype=np.float32) * 16.0)
 
-        # Verify it's valid base64
-        try:
-            decoded = base64.b64decode(base64_image)
-            print(f"Decoded BMP size: {len(decoded)} bytes")
-            assert decoded[:2] == b"BM", "Decoded data should be BMP"
-            print("✓ Base64 encoding test passed")
-            self.passed_count += 1
-        except Exception as e:
-            print(f"✗ Base64 decoding failed: {e}")
-            raise
+    # A compact-sized packet flagged as uint16 must be rejected
+    bad_header = struct.pack("<IIfHH", 7, 2000, 25.0, 60, StoveLinkDecoder.BODY_FORMAT_UINT16)
+    with pytest.raises(ValueError):
+        decoder.decode_packet(bad_header + body)
 
-    def test_fixed_temperature_range(self):
-        """Test fixed min/max temperature range"""
-        print("\n=== Test 7: Fixed Temperature Range ===")
-        self.test_count += 1
-
-        # Create generator with fixed range 0-100°C
-        fixed_generator = ThermalImageGenerator(width=32, height=24, min_temp=0.0, max_temp=100.0)
-
-        # Create frame with temperatures outside the fixed range
-        frame = np.ones((24, 32), dtype=np.float32) * 200.0  # All pixels 200°C
-
-        # Generate RGB with fixed range
-        rgb_fixed = fixed_generator.frame_to_rgb(frame)
-
-        # Generate RGB with dynamic range (should be all white since all same temp)
-        rgb_dynamic = self.generator.frame_to_rgb(frame)
-
-        print(f"Frame temperature: {frame[0, 0]:.1f}°C")
-        print(f"Fixed range: 0-100°C")
-        print(f"Dynamic range: {frame.min():.1f}-{frame.max():.1f}°C")
-
-        # With fixed range 0-100, 200°C should map to max (1.0 normalized)
-        # In ironbow, max temp is red
-        avg_r_fixed = np.mean(rgb_fixed[:, :, 0])
-        avg_g_fixed = np.mean(rgb_fixed[:, :, 1])
-        avg_b_fixed = np.mean(rgb_fixed[:, :, 2])
-
-        print(f"Fixed range RGB avg: R={avg_r_fixed:.1f}, G={avg_g_fixed:.1f}, B={avg_b_fixed:.1f}")
-
-        # Should be red (high R, low G/B)
-        assert avg_r_fixed > 200, "Fixed range should produce red colors for high temp"
-        assert avg_g_fixed < 100, "Fixed range should have low green"
-        assert avg_b_fixed < 100, "Fixed range should have low blue"
-
-        print("✓ Fixed temperature range test passed")
-        self.passed_count += 1
-
-    def test_stovelink_decoder_integration(self):
-        """Test integration with StoveLinkDecoder"""
-        print("\n=== Test 8: StoveLink Decoder Integration ===")
-        self.test_count += 1
-
-        decoder = StoveLinkDecoder()
-
-        # Create a test packet
-        header = struct.pack(
-            "<IIfHH",
-            0,  # sequence_id
-            1000,  # timestamp_ms
-            50.0,  # vent_pct
-            300,  # combustion_time
-            0,
-        )  # reserved
-
-        # Create thermal data with left-right gradient
-        thermal_data = []
-        for i in range(768):
-            # Create pattern: left side cooler, right side hotter
-            pixel_idx = i % 32  # Column index (0-31)
-            temp = 20.0 + (pixel_idx / 32.0) * 60.0  # 20-80°C gradient
-            thermal_data.append(int(temp * 10))  # Convert to 0.1°C units
-
-        body = struct.pack("<768H", *thermal_data)
-        packet = header + body
-
-        # Decode packet
-        decoded = decoder.decode_packet(packet)
-        thermal_frame = decoded["thermal_frame"]
-
-        print(f"Decoded thermal frame shape: {thermal_frame.shape}")
-        print(f"Frame min temp: {thermal_frame.min():.1f}°C, max temp: {thermal_frame.max():.1f}°C")
-
-        # Generate RGB image (should be flipped)
-        rgb_data = self.generator.frame_to_rgb(thermal_frame)
-
-        print(f"Generated RGB shape: {rgb_data.shape}")
-
-        # After flip, left should be hot, right should be cool
-        left_pixels = rgb_data[:, :8, :]
-        right_pixels = rgb_data[:, -8:, :]
-
-        left_avg_r = np.mean(left_pixels[:, :, 0])
-        right_avg_r = np.mean(right_pixels[:, :, 0])
-
-        print(f"After flip - Left R avg: {left_avg_r:.1f}, Right R avg: {right_avg_r:.1f}")
-        assert left_avg_r > right_avg_r, "Flip should reverse temperature gradient"
-
-        print("✓ StoveLink decoder integration test passed")
-        self.passed_count += 1
-
-    def run_all_tests(self):
-        """Run all test cases"""
-        print("=" * 60)
-        print("ThermalImageGenerator Test Suite")
-        print("=" * 60)
-
-        try:
-            self.test_frame_to_rgb_shape()
-            self.test_horizontal_flip()
-            self.test_grayscale_colormap()
-            self.test_ironbow_colormap()
-            self.test_encode_bmp()
-            self.test_base64_encoding()
-            self.test_fixed_temperature_range()
-            self.test_stovelink_decoder_integration()
-
-            print("\n" + "=" * 60)
-            print(f"✓ All tests passed! ({self.passed_count}/{self.test_count})")
-            print("=" * 60)
-            return True
-        except AssertionError as e:
-            print(f"\n✗ Test failed: {e}")
-            print(f"Tests passed: {self.passed_count}/{self.test_count}")
-            return False
-        except Exception as e:
-            print(f"\n✗ Unexpected error: {e}")
-            import traceback
-
-            traceback.print_exc()
-            return False
+    print("✓ StoveLink decoder compact format test passed")
 
 
 if __name__ == "__main__":
-    tester = TestThermalImageGenerator()
-    success = tester.run_all_tests()
-    sys.exit(0 if success else 1)
+    sys.exit(pytest.main([__file__, "-v"]))
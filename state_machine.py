@@ -1,5 +1,22 @@
+import time
+
+# Exception raised by mqtt_client.loop() when the client is disconnected.
+# Socket errors (the OSError family) are deliberately not included: they must reach
+# the main loop so MQTTConnectionManager reconnects even if the client still reports connected.
+try:
+    from adafruit_minimqtt.adafruit_minimqtt import MMQTTStateError
+    _MQTT_DISCONNECT_ERRORS = (MMQTTStateError,)
+except ImportError:
+    _MQTT_DISCONNECT_ERRORS = ()
+
+
 class State:
     """Base class for states in the state machine"""
+    __slots__ = ("name",)
+
+    # True if update() may run in the same tick the state was entered from another state's update()
+    inline_update = False
+
     def __init__(self, name):
         self.name = name
         
@@ -29,12 +46,33 @@ class State:
 
 class StateMachine:
      """Simple state machine implementation"""
+     # Fixed attribute layout; arbitrary per-state values belong in self.data
+     __slots__ = (
+         "states",
+         "current_state",
+         "current_state_obj",
+         "previous_state",
+         "state_stack",
+         "data",
+         "_last_mqtt_loop",
+         "tick_time",
+     )
+
+     # Minimum seconds between mqtt_client.loop() calls (20 Hz); faster ticks skip polling
+     MQTT_LOOP_INTERVAL = 0.05
+
+     # Maximum number of inline_update states run after transitions within one update()
+     MAX_INLINE_TRANSITIONS = 2
+
      def __init__(self, initial_state=None):
          self.states = {}
          self.current_state = None
+         self.current_state_obj = None  # Cached reference to states[current_state]
          self.previous_state = None
          self.state_stack = []
          self.data = {}  # Shared data between states
+         self._last_mqtt_loop = 0.0  # time.monotonic() of the last mqtt_client.loop()
+         self.tick_time = 0.0  # time.monotonic() at the start of the current update()
          
          if initial_state:
              self.add_state(initial_state)
@@ -47,7 +85,7 @@ class StateMachine:
      def set_state(self, state_name):
          """Change to a new state"""
          self._transition(state_name)
-         self.states[self.current_state].enter(self)
+         self.current_state_obj.enter(self)
 
      def _transition(self, state_name):
          """Perform state transition steps (exit current, update tracking)"""
@@ -55,12 +93,13 @@ class StateMachine:
              raise ValueError(f"State {state_name} does not exist")
              
          # Exit current state
-         if self.current_state:
-             self.states[self.current_state].exit(self)
+         if self.current_state_obj:
+             self.current_state_obj.exit(self)
              
          # Update state tracking
          self.previous_state = self.current_state
          self.current_state = state_name
+         self.current_state_obj = self.states[state_name]
          
      def push_state(self, state_name):
          """Push the current state to the stack and switch to a new state"""
@@ -73,40 +112,59 @@ class StateMachine:
          if self.state_stack:
              prev_state = self.state_stack.pop()
              self._transition(prev_state)
-             self.states[self.current_state].resume(self)
+             self.current_state_obj.resume(self)
          else:
              # Fallback if stack is empty - perhaps stay or go to idle?
              # For now, do nothing or maybe log warning
              pass
 
      def update(self):
-         """Update the current state"""
-         if self.current_state:
-             self.states[self.current_state].update(self)
+         """
+         Update the current state.
+         States read machine.tick_time rather than calling time.monotonic() themselves,
+         so one clock read serves the whole tick.
+         """
+         self.tick_time = time.monotonic()
+         state = self.current_state_obj
+         if state:
+             state.update(self)
+             # Let the state just transitioned to react in this tick instead of the next
+             for _ in range(self.MAX_INLINE_TRANSITIONS):
+                 if self.current_state_obj is state or not self.current_state_obj.inline_update:
+                     break
+                 state = self.current_state_obj
+                 state.update(self)
      
-     def mqtt_loop(self):
+     def mqtt_loop(self, max_messages=1):
          """
          Safely call mqtt_client.loop() with error handling.
-         Catches MMQTTStateError which occurs when calling loop() on a disconnected client.
+         With max_messages > 1, keeps calling loop() while it reports processed packets,
+         up to max_messages times, so a burst of queued messages is drained in one tick.
+         Catches MMQTTStateError (loop() on a disconnected client); socket errors propagate.
          Logs the error but continues execution—the main loop's MQTTConnectionManager
          handles reconnection on its own schedule.
+         Rate-limited to one poll per MQTT_LOOP_INTERVAL so fast state updates
+         don't spend most of their time polling the socket.
          """
          mqtt_client = self.data.get("mqtt_client")
          if not mqtt_client:
              return
+
+         now = time.monotonic()
+         if now - self._last_mqtt_loop < self.MQTT_LOOP_INTERVAL:
+             return
+         self._last_mqtt_loop = now
          
          try:
-             mqtt_client.loop()
-         except Exception as e:
-             # Catch MMQTTStateError and other exceptions from disconnected MQTT client
-             # The string representation will contain the exception type name
-             if "MMQTTStateError" in str(type(e)) or "not connected" in str(e).lower():
-                 # MQTT client is disconnected - log quietly and continue
-                 # The main loop's MQTTConnectionManager will handle reconnection
-                 pass
-             else:
-                 # Other exceptions should be raised to be handled by the state machine
-                 raise
+             for _ in range(max_messages):
+                 # loop() returns the processed packets' return codes, or None if idle
+                 if not mqtt_client.loop():
+                     break
+         except _MQTT_DISCONNECT_ERRORS:
+             # MQTT client is disconnected - continue quietly
+             # The main loop's MQTTConnectionManager will handle reconnection.
+             # Other exceptions propagate to be handled by the main loop.
+             pass
              
      def get_state(self):
          """Get the current state name"""
@@ -117,6 +175,6 @@ class StateMachine:
          Attempt to handle a vent move request by delegating to the current state.
          Returns True if accepted, False otherwise.
          """
-         if self.current_state and self.current_state in self.states:
-             return self.states[self.current_state].handle_move_request(self, vent_position)
+         if self.current_state_obj:
+             return self.current_state_obj.handle_move_request(self, vent_position)
          return False
@@ -1,3 +1,4 @@
+import array
 import struct
 import time
 import adafruit_logging as logging
@@ -15,6 +16,17 @@ except ImportError:
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# StoveLink header: <IIfHH = uint32, uint32, float32, uint16, uint16
+HEADER_FORMAT = '<IIfHH'
+
+try:
+    # Compile the header format once rather than parsing it on every packet
+    _pack_header_into = struct.Struct(HEADER_FORMAT).pack_into
+except AttributeError:
+    # CircuitPython's struct module has no Struct class
+    def _pack_header_into(buffer, offset, *fields):
+        struct.pack_into(HEADER_FORMAT, buffer, offset, *fields)
+
 
 class StoveLinkEncoder:
     """
@@ -29,17 +41,45 @@ class StoveLinkEncoder:
         - Timestamp (uint32, 4 bytes): Milliseconds since boot
         - Vent Position (float32, 4 bytes): 0.0 (closed) to 100.0 (open)
         - Combustion Time (uint16, 2 bytes): Seconds since burn cycle start
-        - Reserved (uint16, 2 bytes): Padding for alignment
-    - Body (1536 bytes):
+        - Body Format (uint16, 2 bytes): BODY_FORMAT_UINT16 (0) or BODY_FORMAT_UINT8 (1).
+          Previously reserved padding, always 0, so older packets decode unchanged.
+    - Body (1536 bytes, BODY_FORMAT_UINT16):
         - Thermal Frame (768 x uint16): Temperature data in 0.1°C units
+    - Body (768 bytes, BODY_FORMAT_UINT8, see encode_packet_compact):
+        - Thermal Frame (768 x uint8): Temperature data in 2°C units (0-510°C)
     
-    Total packet size: 1552 bytes
+    Total packet size: 1552 bytes (784 bytes compact)
     """
     
+    HEADER_SIZE = 16
+    BODY_SIZE = 1536
+    PACKET_SIZE = HEADER_SIZE + BODY_SIZE
+    COMPACT_BODY_SIZE = 768
+    COMPACT_PACKET_SIZE = HEADER_SIZE + COMPACT_BODY_SIZE
+    
+    BODY_FORMAT_UINT16 = 0
+    BODY_FORMAT_UINT8 = 1
+    
     def __init__(self):
         """Initialize StoveLink encoder with sequence counter."""
         self.sequence_id = 0
         self.boot_time = time.monotonic()
+        # Reusable uint16 frame buffer for the non-numpy path (no per-frame allocation)
+        self._frame_u16 = array.array('H', [0] * 768)
+        # Reusable packet buffer; header and body are written in place each frame
+        self._packet = bytearray(self.PACKET_SIZE)
+        # Same for the compact (uint8) format
+        self._frame_u8 = array.array('B', [0] * 768)
+        self._compact_packet = bytearray(self.COMPACT_PACKET_SIZE)
+        if np is not None:
+            # Typed views of the packet bodies, so ndarray bodies are copied in element-wise
+            self._packet_body = np.frombuffer(self._packet, dtype=np.uint16, offset=self.HEADER_SIZE)
+            self._compact_body = np.frombuffer(
+                self._compact_packet, dtype=np.uint8, offset=self.HEADER_SIZE
+            )
+        else:
+            self._packet_body = None
+            self._compact_body = None
         
     def encode_packet(
         self, 
@@ -64,6 +104,122 @@ class StoveLinkEncoder:
         if len(thermal_frame) != 768:
             raise ValueError(f"Thermal frame must contain 768 values, got {len(thermal_frame)}")
         
+        # Convert temperatures to uint16 (multiply by 10)
+        # Use vectorized operations if numpy array available, otherwise iterate
+        if np is not None and type(thermal_frame) == np.ndarray:
+            # Use numpy for efficient vectorized conversion
+            # Multiply by 10 and round, so the uint16 cast below doesn't truncate
+            thermal_uint16 = np.around(thermal_frame * 10.0)
+            # Clamp values to uint16 range (0-65535)
+            thermal_uint16 = np.clip(thermal_uint16, 0, 65535)
+            # Convert to uint16 dtype - ulab doesn't have astype, use array constructor.
+            # ulab has no byte-order dtypes; native order is little-endian on ESP32.
+            thermal_uint16 = np.array(thermal_uint16, dtype=np.uint16)
+        else:
+            # Fallback to list iteration, filling the preallocated buffer in place
+            thermal_uint16 = self._frame_u16
+            for i, temp_celsius in enumerate(thermal_frame):
+                # Convert to 0.1°C units (rounded, matching the numpy path) and clamp
+                temp_uint16 = round(temp_celsius * 10)
+                thermal_uint16[i] = max(0, min(temp_uint16, 65535))
+        
+        return self.encode_packet_from_raw_u16(thermal_uint16, vent_position, combustion_time)
+    
+    def encode_packet_from_raw_u16(
+        self,
+        thermal_u16,
+        vent_position: float,
+        combustion_time: int = 0
+    ) -> bytes:
+        """
+        Encode a thermal frame already converted to 0.1°C units into StoveLink binary format.
+        
+        Preferred for internal callers that keep a persistent uint16 buffer, since
+        no per-frame conversion or intermediate list is needed.
+        
+        Args:
+            thermal_u16: Buffer of 768 uint16 values in 0.1°C units (array.array('H'),
+                uint16 numpy array, or memoryview cast to 'H'), in native (little-endian) order
+            vent_position: Vent position from 0.0 (fully open) to 1.0 (fully closed)
+            combustion_time: Seconds since burn cycle started (default: 0)
+            
+        Returns:
+            bytes: Binary packet (1552 bytes) ready for MQTT transmission
+            
+        Raises:
+            ValueError: If thermal_u16 doesn't contain exactly 768 values
+        """
+        if len(thermal_u16) != 768:
+            raise ValueError(f"Thermal frame must contain 768 values, got {len(thermal_u16)}")
+        
+        return self._encode(
+            self._packet,
+            self._packet_body,
+            thermal_u16,
+            self.BODY_FORMAT_UINT16,
+            vent_position,
+            combustion_time,
+        )
+    
+    def encode_packet_compact(
+        self,
+        thermal_frame,
+        vent_position: float,
+        combustion_time: int = 0
+    ) -> bytes:
+        """
+        Encode thermal frame and metadata into the compact StoveLink format.
+        
+        Temperatures are quantized to uint8 in 2°C units (0-510°C), halving the body
+        to 768 bytes. Plenty for stove monitoring, where 0.1°C resolution is unused.
+        
+        Args:
+            thermal_frame: List or numpy array of 768 temperature values in Celsius (32x24 pixels)
+            vent_position: Vent position from 0.0 (fully open) to 1.0 (fully closed)
+            combustion_time: Seconds since burn cycle started (default: 0)
+            
+        Returns:
+            bytes: Binary packet (784 bytes) ready for MQTT transmission
+            
+        Raises:
+            ValueError: If thermal_frame doesn't contain exactly 768 values
+        """
+        if len(thermal_frame) != 768:
+            raise ValueError(f"Thermal frame must contain 768 values, got {len(thermal_frame)}")
+        
+        if np is not None and type(thermal_frame) == np.ndarray:
+            # Halve, round and clamp to uint8 range (0-255)
+            thermal_uint8 = np.clip(np.around(thermal_frame * 0.5), 0, 255)
+            thermal_uint8 = np.array(thermal_uint8, dtype=np.uint8)
+        else:
+            thermal_uint8 = self._frame_u8
+            for i, temp_celsius in enumerate(thermal_frame):
+                thermal_uint8[i] = max(0, min(round(temp_celsius * 0.5), 255))
+        
+        return self._encode(
+            self._compact_packet,
+            self._compact_body,
+            thermal_uint8,
+            self.BODY_FORMAT_UINT8,
+            vent_position,
+            combustion_time,
+        )
+    
+    def _encode(self, packet, body_view, body, body_format, vent_position, combustion_time):
+        """
+        Write header and body into a reusable packet buffer and return a copy.
+        
+        Args:
+            packet: Preallocated packet bytearray (header + body size)
+            body_view: ulab view of the packet body with the body's dtype, or None without ulab
+            body: Buffer holding the already-converted thermal body
+            body_format: BODY_FORMAT_UINT16 or BODY_FORMAT_UINT8
+            vent_position: Vent position from 0.0 (fully open) to 1.0 (fully closed)
+            combustion_time: Seconds since burn cycle started
+            
+        Returns:
+            bytes: Binary packet
+        """
         # Convert vent position from 0.0-1.0 (open-closed) to 0.0-100.0 (closed-open)
         # Invert: 0.0 open becomes 100.0, 1.0 closed becomes 0.0
         vent_position_percent = (1.0 - vent_position) * 100.0
@@ -75,57 +231,48 @@ class StoveLinkEncoder:
         # Clamp combustion_time to uint16 range (0-65535 seconds)
         combustion_time = max(0, min(combustion_time, 65535))
         
-        # Build header (16 bytes) - Little-Endian format
-        # Format: <IIfHH = uint32, uint32, float32, uint16, uint16
-        header = struct.pack(
-            '<IIfHH',
+        # Write header (16 bytes) - Little-Endian format
+        _pack_header_into(
+            packet,
+            0,
             self.sequence_id,       # Sequence ID (uint32)
             timestamp_ms,            # Timestamp (uint32)
             vent_position_percent,   # Vent Position (float32)
             combustion_time,         # Combustion Time (uint16)
-            0                        # Reserved/padding (uint16)
+            body_format              # Body Format (uint16)
         )
         
-        # Build body - convert temperatures to uint16 (multiply by 10)
-        # Use vectorized operations if numpy array available, otherwise iterate
-        # Format: <768H = 768 x uint16
-        if np is not None and type(thermal_frame) == np.ndarray:
-            # Use numpy for efficient vectorized conversion
-            # Multiply by 10, convert to int, and clamp to uint16 range
-            thermal_uint16 = thermal_frame * 10.0
-            # Clamp values to uint16 range (0-65535)
-            thermal_uint16 = np.clip(thermal_uint16, 0, 65535)
-            # Convert to uint16 dtype - ulab doesn't have astype, use array constructor
-            thermal_uint16 = np.array(thermal_uint16, dtype=np.uint16)
-            # Use tobytes() for direct binary conversion (little-endian on ESP32)
-            body = thermal_uint16.tobytes()
+        # Write body - raw bytes of the thermal buffer (little-endian on ESP32)
+        if body_view is not None and type(body) == np.ndarray:
+            # Element-wise copy through the typed view; bytearray slice assignment from a
+            # uint16 buffer fails on MicroPython (item sizes differ)
+            body_view[:] = body
         else:
-            # Fallback to list iteration
-            thermal_data = []
-            for temp_celsius in thermal_frame:
-                # Convert to 0.1°C units and clamp to uint16 range
-                temp_uint16 = int(temp_celsius * 10)
-                temp_uint16 = max(0, min(temp_uint16, 65535))
-                thermal_data.append(temp_uint16)
-            
-            body = struct.pack('<768H', *thermal_data)
+            body_bytes = bytes(body)
+            if len(body_bytes) != len(packet) - self.HEADER_SIZE:
+                # Slice assignment would silently resize the reused packet buffer
+                raise ValueError(
+                    f"Thermal body must be {len(packet) - self.HEADER_SIZE} bytes, got {len(body_bytes)}"
+                )
+            packet[self.HEADER_SIZE:] = body_bytes
         
         # Increment sequence counter (wraps at 2^32)
         self.sequence_id = (self.sequence_id + 1) % 0x100000000
         
-        # Combine header and body
-        packet = header + body
-        
-        logger.debug(
-            "StoveLink packet: seq=%d, ts=%d, vent=%.1f%%, comb=%ds, size=%d",
-            self.sequence_id - 1,  # Log the ID we just sent
-            timestamp_ms,
-            vent_position_percent,
-            combustion_time,
-            len(packet)
-        )
+        # adafruit_logging doesn't always short-circuit disabled levels, so skip
+        # building the call entirely unless DEBUG is enabled
+        if logger.getEffectiveLevel() <= logging.DEBUG:
+            logger.debug(
+                "StoveLink packet: seq=%d, ts=%d, vent=%.1f%%, comb=%ds, size=%d",
+                self.sequence_id - 1,  # Log the ID we just sent
+                timestamp_ms,
+                vent_position_percent,
+                combustion_time,
+                len(packet)
+            )
         
-        return packet
+        # MQTT publish needs an immutable copy; the buffer is reused next frame
+        return bytes(packet)
     
     def reset_sequence(self):
         """Reset sequence counter to zero (useful for testing)."""
@@ -139,4 +286,4 @@ class StoveLinkEncoder:
         Returns:
             int: Packet size (1552 bytes)
         """
-        return 16 + 1536  # Header + Body
+        return self.PACKET_SIZE  # Header + Body
@@ -1,3 +1,4 @@
+import math
 import time
 
 try:
@@ -9,6 +10,11 @@ from state_machine import State, StateMachine
 
 logger = logging.getLogger(__name__)
 
+_LN_1000 = math.log(1000)
+
+# Number of set bits in a 3-bit history mask
+_BIT_COUNT_3 = (0, 1, 1, 2, 1, 2, 2, 3)
+
 
 class VentFunctionABC():
     """Abstract base class for an adjustable air vent position vs time function. Calculates the desired
@@ -32,11 +38,29 @@ class VentFunctionABC():
 
     def get_position(self):
         "Calculates the position at the current (adjusted) time"
+        return self._position_at(self.get_adjusted_time())
+
+    def _position_at(self, t):
+        "Calculates the position at adjusted time t (seconds since start)"
         raise NotImplementedError
 
     def inverse(self, position) -> float:
-        "Returns the time for given position in range (0, time_range)"
-        raise NotImplementedError
+        """Returns the time for given position in range (0, time_range).
+        Default: binary search over _position_at(), valid for any profile that is monotone
+        in time. Subclasses with a closed-form inverse should override this."""
+        lo, hi = 0, int(self.time_range)
+        while hi - lo > 1:
+            mid = (lo + hi) >> 1
+            if self._position_at(mid) < position:
+                lo = mid
+            else:
+                hi = mid
+        return lo
+
+    def time_until_next_step(self, current_position, step_resolution) -> float:
+        """Returns the time (seconds) for the position to advance by step_resolution from
+        current_position. 0 means unknown, i.e. the caller should check again as soon as possible."""
+        return 0.0
 
     def get_elapsed_time(self):
         "Get time since start() was called, un-adjusted"
@@ -62,52 +86,158 @@ class LinearVentFunction(VentFunctionABC):
     """Just a simple straight line.
     """
 
+    def start(self, vent_current_position):
+        super().start(vent_current_position)
+        # The span is fixed for the run; time_range isn't (it can be changed over MQTT)
+        self._span = 1.0 - vent_current_position
+        self._inv_span = 1.0 / self._span if self._span > 1e-6 else 0.0
+
     def inverse(self, position):
-        pct_moved = (position - self.start_position) / (1.0 - self.start_position)
-        return int(self.time_range * pct_moved)
+        return int(self.time_range * (position - self.start_position) * self._inv_span)
 
-    def get_position(self):
-        pct_time = self.get_adjusted_time() / self.time_range
-        target_pos = self.start_position + (1.0 - self.start_position) * pct_time
+    def _position_at(self, t):
+        target_pos = self.start_position + self._span * t / self.time_range
         target_pos = max(0.0, min(target_pos, 1.0))
         return target_pos
 
+    def time_until_next_step(self, current_position, step_resolution):
+        "Constant slope, so the time per step doesn't depend on the current position"
+        return self.time_range * step_resolution * self._inv_span if self._inv_span else self.time_range
+
+
+class ExponentialVentFunction(VentFunctionABC):
+    """Exponential approach to the closed position, like a vent driven by a constant-voltage
+    DC motor: large moves early in free travel, then progressively finer steps towards closure.
+    tau is the time constant in seconds; by default it follows time_range so the profile
+    reaches 99.9% of the way at time_range, including after time_range is changed.
+    """
+
+    def __init__(self, time_range=30*60, time_func=time.time, tau=None):
+        super().__init__(time_range, time_func)
+        self._tau = tau
+
+    @property
+    def tau(self):
+        if self._tau is not None:
+            return self._tau
+        return self.time_range / _LN_1000
+
+    def start(self, vent_current_position):
+        super().start(vent_current_position)
+        self._span = 1.0 - vent_current_position
+        self._inv_span = 1.0 / self._span if self._span > 1e-6 else 0.0
+
+    def inverse(self, position):
+        remaining = 1.0 - (position - self.start_position) * self._inv_span
+        if remaining <= 0:
+            # Never actually reached; treat as the end of the range
+            return int(self.time_range)
+        return int(-self.tau * math.log(remaining))
+
+    def _position_at(self, t):
+        decay = math.exp(-t / self.tau)
+        target_pos = self.start_position + self._span * (1.0 - decay)
+        target_pos = max(0.0, min(target_pos, 1.0))
+        return target_pos
+
+    def time_until_next_step(self, current_position, step_resolution):
+        "Time for the remaining distance to shrink from (1 - p) to (1 - p - step_resolution)"
+        remaining = 1.0 - current_position
+        if remaining - step_resolution <= 0:
+            return self.time_range
+        return self.tau * math.log(remaining / (remaining - step_resolution))
+
 
 class Monitoring(State):
+    """Watch for manual override and wait until the function has moved far enough to close.
+    Between checks the state sleeps cooperatively (update returns immediately) until the
+    trajectory is due to move again, but never longer than override_poll_interval.
+    An override needs the displacement to exceed override_sensitivity on 2 of the last 3 polls,
+    starting with a move faster than override_min_velocity (position/s), so encoder noise spikes
+    and slow drift don't trigger it.
+    """
+
+    inline_update = True
 
-    def __init__(self, min_steps = 8, override_sensitivity = 0.01):
+    def __init__(self, min_steps = 8, override_sensitivity = 0.01, override_poll_interval = 0.5,
+                 override_min_velocity = 0.01):
         super().__init__("monitoring")
         self.min_steps = min_steps
         self.override_sensitivity = override_sensitivity
+        self.override_poll_interval = override_poll_interval
+        self.override_min_velocity = override_min_velocity
+        self._next_poll_time = 0
+
+    def _reset_override_detection(self, position):
+        self.vent_position = position
+        self._last_poll_position = position
+        self._last_poll_time = time.monotonic()
+        self._override_history = 0  # bit 0 is the latest poll, set if it was beyond sensitivity
 
     def enter(self, machine):
         "Record the initial vent position for override detection"
-        hardware = machine.data["hardware"]
-        vent = machine.data["vent"]
-        vent.update_from_hardware(hardware.read_raw_angle())
-        self.vent_position = vent.get_position()
+        # Look up shared objects once per entry rather than on every update
+        self._hardware = hardware = machine.data["hardware"]
+        self._vent = vent = machine.data["vent"]
+        self._function = machine.data["function"]
+        self._step_size = vent.get_step_size()
+        self._next_poll_time = 0
+        self._last_raw_angle = None
+        vent.update_from_hardware(hardware.read_raw_angle_cached())
+        self._reset_override_detection(vent.get_position())
         logger.info("Monitoring: vent_position=%.3f", self.vent_position)
         hardware.set_pixel_blue()
 
     def resume(self, machine):
         "Update vent_position to prevent erroneous override detection"
-        hardware = machine.data["hardware"]
-        vent = machine.data["vent"]
-        vent.update_from_hardware(hardware.read_raw_angle())
-        self.vent_position = vent.get_position()
+        vent = self._vent
+        vent.update_from_hardware(self._hardware.read_raw_angle_cached())
+        self._reset_override_detection(vent.get_position())
+        self._next_poll_time = 0
+        self._last_raw_angle = None
 
     def update(self, machine):
-        hardware = machine.data["hardware"]
-        vent = machine.data["vent"]
-        func = machine.data["function"]
-        machine.mqtt_loop()
-        vent.update_from_hardware(hardware.read_raw_angle())
+        now = machine.tick_time
+        if now < self._next_poll_time:
+            return
+        hardware = self._hardware
+        vent = self._vent
+        func = self._function
+        machine.mqtt_loop(max_messages=8)
+        raw_angle = hardware.read_raw_angle_cached()
+        if raw_angle == self._last_raw_angle:
+            # Encoder unchanged: no override, and no need to recompute steps until the
+            # trajectory has drifted far enough that min_steps could have been reached
+            ideal_position = func.get_position()
+            drift = abs(ideal_position - self._last_ideal_position)
+            if drift < self._step_slack and ideal_position <= 0.999:
+                # Still a poll for the override velocity check: the position is unchanged
+                self._last_poll_time = now
+                trajectory_dt = func.time_until_next_step(ideal_position, self._step_slack - drift)
+                self._next_poll_time = now + min(trajectory_dt, self.override_poll_interval)
+                return
+        vent.update_from_hardware(raw_angle)
 
         # Override detection
-        displacement = vent.get_position() - self.vent_position
-        if abs(displacement) > self.override_sensitivity:
+        position = vent.get_position()
+        displacement = position - self.vent_position
+        history = self._override_history
+        beyond = abs(displacement) > self.override_sensitivity
+        if beyond and not history & 3:
+            # A new excursion only counts if the vent moved quickly since the previous poll
+            dt = max(now - self._last_poll_time, 0.001)
+            beyond = abs(position - self._last_poll_position) > self.override_min_velocity * dt
+        self._last_poll_position = position
+        self._last_poll_time = now
+        self._override_history = history = ((history << 1) | beyond) & 7
+        if beyond:
             logger.debug("monitoring: displacement=%.3f", displacement)
-            machine.set_state("override")
+            if _BIT_COUNT_3[history] >= 2:
+                machine.set_state("override")
+            else:
+                # Unconfirmed: hold off closing and check again next tick
+                self._last_raw_angle = None
+                self._next_poll_time = now
         else:
             # Should initiate motion?
             ideal_position = func.get_position()
@@ -116,6 +246,16 @@ class Monitoring(State):
             if steps >= self.min_steps or ideal_position > 0.999:
                 # Initiate motion
                 machine.set_state("closing")
+            else:
+                # Nothing to do until the trajectory has moved the remaining steps
+                self._last_raw_angle = raw_angle
+                self._last_ideal_position = ideal_position
+                # Position change that cannot yet add up to min_steps, allowing a step for rounding
+                self._step_slack = (self.min_steps - steps - 1) * self._step_size
+                trajectory_dt = func.time_until_next_step(
+                    ideal_position, (self.min_steps - steps) * self._step_size
+                )
+                self._next_poll_time = now + min(trajectory_dt, self.override_poll_interval)
 
     def handle_move_request(self, machine, target_position):
         "Always allow manual move requests while monitoring"
@@ -133,32 +273,35 @@ class Override(State):
 
     def enter(self, machine):
         logger.info("Detected manual override")
-        hardware = machine.data["hardware"]
-        vent = machine.data["vent"]
-        vent.update_from_hardware(hardware.read_raw_angle())
+        self._hardware = hardware = machine.data["hardware"]
+        self._vent = vent = machine.data["vent"]
+        self._function = machine.data["function"]
+        vent.update_from_hardware(hardware.read_raw_angle_cached())
         self.vent_position = vent.get_position()
         hardware.set_pixel_green()
-        self.last_check_time = time.time()
+        # May be entered outside an update() (e.g. on resume), so don't rely on tick_time
+        self.last_check_time = time.monotonic()
         logger.info("Override: vent_position=%.3f", self.vent_position)
 
     def update(self, machine):
-        hardware = machine.data["hardware"]
-        vent = machine.data["vent"]
+        hardware = self._hardware
+        vent = self._vent
+        now = machine.tick_time
 
         # Override detection
-        vent.update_from_hardware(hardware.read_raw_angle())
+        vent.update_from_hardware(hardware.read_raw_angle_cached())
         position = vent.get_position()
         displacement = position - self.vent_position
         if abs(displacement) > self.sensitivity:
             # Movement observed - update vent position and indicate vent is open if it is
-            self.last_check_time = time.time()
+            self.last_check_time = now
             self.vent_position = position
             if position < self.open_position_threshold:
                 # Indicate vent is open
                 hardware.set_pixel_color((0, 64, 64))  # teal
-        elif time.time() - self.last_check_time > self.settle_time:
+        elif now - self.last_check_time > self.settle_time:
             # No movement ovserved for the settling time
-            func = machine.data["function"]
+            func = self._function
             if machine.data["vent_closed"] and position < self.open_position_threshold:
                 # Vent moved open - reset function to start
                 func.start(position)
@@ -174,6 +317,8 @@ class Closing(State):
     """Close the air vent by the amount needed.
     """
 
+    inline_update = True
+
     def __init__(self, min_steps = 5, overshoot = 2, closed_threshold = 0.999):
         super().__init__("closing")
         self.min_steps = min_steps
@@ -181,24 +326,34 @@ class Closing(State):
         self.closed_threshold = closed_threshold
 
     def enter(self, machine):
-        hardware = machine.data["hardware"]
+        self._hardware = hardware = machine.data["hardware"]
+        self._vent = vent = machine.data["vent"]
         hardware.set_pixel_red()
         func = machine.data["function"]
-        self.ideal_position = func.get_position()
-        logger.info("Closing to position %.3f", self.ideal_position)
+        self.ideal_position = ideal_position = func.get_position()
+        logger.info("Closing to position %.3f", ideal_position)
+        # Plan the first move now; updates only re-read the encoder after a move
+        self._plan = None
+        if ideal_position < self.closed_threshold:
+            vent.update_from_hardware(hardware.read_raw_angle_cached())
+            self._plan = vent.move_to_position(ideal_position)
 
     def update(self, machine):
-        hardware = machine.data["hardware"]
-        vent = machine.data["vent"]
         if self.ideal_position < self.closed_threshold:
-            vent.update_from_hardware(hardware.read_raw_angle())
-            steps, direction, encoder, revs = vent.move_to_position(self.ideal_position)
+            plan = self._plan
+            if plan is None:
+                # Re-sync with the encoder to see where the last move ended up
+                vent = self._vent
+                vent.update_from_hardware(self._hardware.read_raw_angle_cached())
+                plan = vent.move_to_position(self.ideal_position)
+            else:
+                self._plan = None
+            steps, direction, encoder, revs = plan
             logger.debug("ideal_position=%.3f, steps=%d, direction=%d", self.ideal_position, steps, direction)
             if steps > self.min_steps:
-                if direction == vent.DIR_OPEN:
-                    hardware.open_vent(steps + self.overshoot)
-                elif direction == vent.DIR_CLOSE:
-                    hardware.close_vent(steps + self.overshoot)
+                steps += self.overshoot
+                # direction is Vent.DIR_CLOSE (1) or Vent.DIR_OPEN (0); hardware.move() closes on positive
+                self._hardware.move(steps if direction else -steps)
             else:
                 machine.set_state("monitoring")
         else:
@@ -217,35 +372,42 @@ class Closed(State):
         self.sensitivity = sensitivity
 
     def enter(self, machine):
-        hardware = machine.data["hardware"]
-        vent = machine.data["vent"]
+        self._hardware = hardware = machine.data["hardware"]
+        self._vent = vent = machine.data["vent"]
+        self._function = machine.data["function"]
         hardware.set_pixel_white()
-        machine.mqtt_loop()
-        vent.update_from_hardware(hardware.read_raw_angle())
+        machine.mqtt_loop(max_messages=8)
+        vent.update_from_hardware(hardware.read_raw_angle_cached())
         steps, direction, encoder, revs = vent.move_to_position(1.0)
         # brute force
         hardware.close_vent(steps + self.extra_steps)
         time.sleep(0.1)
-        vent.update_from_hardware(hardware.read_raw_angle())
+        self._last_raw_angle = raw_angle = hardware.read_raw_angle_cached()
+        vent.update_from_hardware(raw_angle)
         self.last_position = vent.get_position()
+        # Position below which the vent counts as moving open
+        self._reopen_position = self.last_position - 0.01
         machine.data["vent_closed"] = True
         logger.info("Closed")
 
     def update(self, machine):
-        hardware = machine.data["hardware"]
-        vent = machine.data["vent"]
-
-        vent.update_from_hardware(hardware.read_raw_angle())
+        raw_angle = self._hardware.read_raw_angle_cached()
+        if raw_angle == self._last_raw_angle:
+            # Encoder unchanged since the last tick: the vent is stable, nothing else to check
+            machine.mqtt_loop(max_messages=8)
+            return
+        self._last_raw_angle = raw_angle
+        vent = self._vent
+        vent.update_from_hardware(raw_angle)
         vent_position = vent.get_position()
         # Check MQTT when vent position is stable
         if abs(vent_position - self.last_position) < self.sensitivity:
-            machine.mqtt_loop()
-        if vent_position < self.last_position - 0.01:
+            machine.mqtt_loop(max_messages=8)
+        if vent_position < self._reopen_position:
             # Vent is moving open
             machine.set_state("override")
         if vent_position < self.open_position_threshold:
-            func = machine.data["function"]
-            func.start(vent_position)
+            self._function.start(vent_position)
             machine.set_state("monitoring")
 
     def handle_move_request(self, machine, target_position):
@@ -284,10 +446,10 @@ class VentCloser(State):
     def enter(self, machine):
         for key in "vent", "hardware", "mqtt_client":
             self.machine.data[key] = machine.data[key]
-        hardware = machine.data["hardware"]
-        vent = machine.data['vent']
-        vent.update_from_hardware(hardware.read_raw_angle())
-        function = self.machine.data["function"]
+        self._hardware = hardware = machine.data["hardware"]
+        self._vent = vent = machine.data['vent']
+        self._function = function = self.machine.data["function"]
+        vent.update_from_hardware(hardware.read_raw_angle_cached())
         
         # Normal start
         function.start(vent.get_position())
@@ -297,14 +459,12 @@ class VentCloser(State):
 
     def resume(self, machine):
         "Resume current sub-state after adjusting function for new position"
-        hardware = machine.data["hardware"]
-        vent = machine.data['vent']
-        vent.update_from_hardware(hardware.read_raw_angle())
-        function = self.machine.data["function"]
+        vent = self._vent
+        vent.update_from_hardware(self._hardware.read_raw_angle_cached())
         
         # Resuming logic: Adjust function to current position
-        function.adjust(vent.get_position())
-        self.machine.states[self.machine.current_state].resume(self.machine)
+        self._function.adjust(vent.get_position())
+        self.machine.current_state_obj.resume(self.machine)
         logger.info("%s resumed", self.name)
 
     def exit(self, machine):
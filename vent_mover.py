@@ -8,18 +8,35 @@ import time
 
 logger = logging.getLogger(__name__)
 
+
+def trapezoid_chunk(remaining, elapsed_chunks, min_chunk, max_chunk, ramp):
+    """
+    Size of the next motor chunk for a move with `remaining` steps to go.
+    Accelerates from min_chunk by `ramp` steps per chunk up to max_chunk, then decelerates
+    by halving the remaining distance until it is within min_chunk, which finishes in one
+    chunk (so moves of up to min_chunk steps are a single chunk).
+    """
+    if remaining <= min_chunk:
+        return remaining
+    return min(min_chunk + elapsed_chunks * ramp, max_chunk, (remaining + 1) // 2)
+
+
 class MoveVentState(State):
-    def __init__(self, min_steps = 3, overshoot = 2, max_updates=3):
+    def __init__(self, min_steps = 3, overshoot = 2, max_updates=3, ramp=5, max_chunk=20):
         super().__init__("move_vent")
         self.target_position = None
         self.move_chunk = 15 # Move in chunks to not block the loop too long
         self.min_steps = min_steps
         self.overshoot = overshoot # extra steps to counter mechanical friction and compliance
         self.max_updates = max_updates
+        self.ramp = ramp # chunk size change per update when accelerating
+        # Cruise chunk size on long moves; each update blocks for about (max_chunk + overshoot) steps
+        self.max_chunk = max_chunk
 
     def handle_move_request(self, machine, target_position):
         # If we are already moving, just update the target
         self.target_position = target_position
+        self._chunks_done = 0
         logger.info("MoveVentState: target updated to %.3f", self.target_position)
         return True
 
@@ -27,31 +44,43 @@ class MoveVentState(State):
         self.target_position = machine.data.get("target_position")
         logger.info("Moving to %.3f", self.target_position)
         self.update_counter = self.max_updates
+        self._chunks_done = 0
+        self._last_raw_angle = None
+        self._hardware = machine.data["hardware"]
+        self._vent = machine.data["vent"]
 
     def update(self, machine):
-        machine.mqtt_loop()
-        hardware = machine.data["hardware"]
-        vent = machine.data["vent"]
+        machine.mqtt_loop(max_messages=8)
+        hardware = self._hardware
+        vent = self._vent
         
         # Update current position from hardware
-        vent.update_from_hardware(hardware.read_raw_angle())
-        
-        # Calculate moves
-        steps, direction, _, _ = vent.move_to_position(self.target_position)
-        
-        if steps > self.min_steps and self.update_counter > 0:
+        raw_angle = hardware.read_raw_angle_cached()
+        target_position = self.target_position
+        # The encoder didn't move since the last chunk: the motor may be stalled
+        stalled = raw_angle == self._last_raw_angle
+        if not stalled or target_position != self._last_target_position:
+            vent.update_from_hardware(raw_angle)
+            # Calculate moves; reused while the encoder and target are unchanged
+            self._last_move = vent.move_to_position(target_position)
+            self._last_raw_angle = raw_angle
+            self._last_target_position = target_position
+        steps, direction, _, _ = self._last_move
+        move_chunk = self.move_chunk
+        counter = self.update_counter
+
+        if steps > self.min_steps and counter > 0:
             # Move a small amount to avoid blocking main loop too long
-            chunk = min(steps, self.move_chunk) + self.overshoot
-            if direction == vent.DIR_OPEN: # Open (FORWARD)
-                logger.info("MoveVentState: opening %d steps, counter=%d", steps, self.update_counter)
-                hardware.open_vent(chunk)
-            elif direction == vent.DIR_CLOSE: # Close (BACKWARD)
-                logger.info("MoveVentState: closing %d steps, counter=%d", steps, self.update_counter)
-                hardware.close_vent(chunk)
-
-            # Limit the number of minor adjustment updates
-            if steps < self.move_chunk:
-                self.update_counter -= 1
+            logger.info("MoveVentState: %s %d steps, counter=%d",
+                        "closing" if direction else "opening", steps, counter)
+            chunk = trapezoid_chunk(steps, self._chunks_done, move_chunk, self.max_chunk, self.ramp)
+            self._chunks_done += 1
+            move = chunk + self.overshoot
+            # direction is Vent.DIR_CLOSE (1) or Vent.DIR_OPEN (0); hardware.move() closes on positive
+            hardware.move(move if direction else -move)
+
+            # Limit the number of minor adjustment updates, and of chunks that make no progress
+            self.update_counter = counter - (steps < move_chunk or stalled)
         else:
             # Target reached
             logger.info("Target reached, popping state")